@@ -7,6 +7,9 @@ Application is a subclass of command.App. To create each command, define
 a method and decorate it with @Command(syntax). Supported syntax will maybe
 grow with time and need. For each user input, the commands are evaluated in
 the order of definition and only the first matching will be executed.
+Commands inherited from base classes come first, those of the later bases in
+the list of bases before those of the earlier ones (the reversed method
+resolution order). An overridden command keeps the place of the original.
 
 Run the application by calling the class.
 
@@ -33,6 +36,10 @@ list, use the keyword arguments of the __init__ method. To disable automatic
 creation of these commands, pass an empty string as the syntax.
 
 The help message is generated from the docstrings of the handler functions.
+If the user types an unknown command, similar command names are suggested.
+The Levenshtein distance used for that is computed by the rapidfuzz package
+if it is installed, otherwise in pure Python; numba is used for long inputs if
+it is installed.
 
 SUPPORTED SYNTAX:
 syntax is a string, that consists of any number of parts delimited by spaces.
@@ -48,19 +55,137 @@ GNU General Public License, version 2
 """
 
 # Ideas for future extension:
-#  - use the distance.levenshtein metric to better find typos and sort error
-#    messages
 #  - use modular approach to parsing arguments
 
 from __future__ import annotations  # Piping instead of Union
 
-from typing import Callable, Sequence
+from functools import cached_property
+from itertools import groupby
+from typing import Callable, Iterable, Sequence
+import re
 import sys
 
+try:
+    from rapidfuzz import process as _fuzz_process
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
+
+# Whether numba is installed, None until it is needed. Importing and
+# compiling it takes far longer than comparing command names in pure Python,
+# so it is imported only on the first large input.
+_HAS_NUMBA: bool | None = None
+
 
 HELP_WIDTH: int = 78
 MAX_HELP_INDENT: int = 25
 _INITIAL_BADNESS: int = 10000
+# limits of the suggestions offered for an unknown command
+MAX_SUGGESTIONS: int = 5
+MIN_SIMILARITY: float = 0.5
+# number of leading characters of the error messages and the user input that
+# are compared to order the errors of equal badness
+_TIEBREAK_LENGTH: int = 64
+# number of candidates from which their distances are computed in parallel
+_PARALLEL_CANDIDATES: int = 32
+# size of the distance matrices, from which numba pays for its compilation
+_NUMBA_CELLS: int = 1_000_000
+
+
+def _load_numba() -> bool:
+    """Import numba and define the compiled functions on the first call.
+    Return whether numba is installed.
+    """
+    global _HAS_NUMBA, np, _numba_levenshtein, _numba_distances
+    if _HAS_NUMBA is not None:
+        return _HAS_NUMBA
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        _HAS_NUMBA = False
+        return False
+
+    @numba.njit(cache=True, boundscheck=False)
+    def _numba_levenshtein(a, b):
+        """Wagner-Fischer algorithm on arrays of code points, keeping only the
+        last two rows of the matrix.
+        """
+        previous = np.arange(len(b) + 1)
+        current = np.empty_like(previous)
+        for i in range(1, len(a) + 1):
+            current[0] = i
+            for j in range(1, len(b) + 1):
+                current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                                 previous[j - 1] + (a[i - 1] != b[j - 1]))
+            previous, current = current, previous
+        return previous[len(b)]
+
+    @numba.njit(cache=True, parallel=True)
+    def _numba_distances(word, chars, bounds):
+        """Distances of word to all candidates concatenated in chars, the k-th
+        candidate is chars[bounds[k]:bounds[k + 1]].
+        """
+        distances = np.empty(len(bounds) - 1, dtype=np.int64)
+        for k in numba.prange(len(bounds) - 1):
+            distances[k] = _numba_levenshtein(
+                word, chars[bounds[k]:bounds[k + 1]])
+        return distances
+
+    _HAS_NUMBA = True
+    return True
+
+
+def _code_points(string: str):
+    """Return the string as a numpy array of code points, numba must be
+    loaded.
+    """
+    return np.frombuffer(string.encode('utf-32-le'), dtype=np.uint32)
+
+
+def _levenshtein(a: str, b: str) -> int:
+    """Return the Levenshtein distance of the two strings."""
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(a, b)
+    if len(a) * len(b) >= _NUMBA_CELLS and _load_numba():
+        return int(_numba_levenshtein(_code_points(a), _code_points(b)))
+    # Wagner-Fischer algorithm keeping only the last row of the matrix
+    previous: list[int] = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current: list[int] = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _similar(word: str, candidates: Sequence[str]) -> list[str]:
+    """Return at most MAX_SUGGESTIONS candidates with normalized Levenshtein
+    similarity to word at least MIN_SIMILARITY, the most similar first.
+    """
+    if _Levenshtein is not None:
+        return [candidate for candidate, _, _ in _fuzz_process.extract(
+            word, candidates, scorer=_Levenshtein.normalized_similarity,
+            limit=MAX_SUGGESTIONS, score_cutoff=MIN_SIMILARITY)]
+    distances: Iterable[int]
+    if (len(candidates) >= _PARALLEL_CANDIDATES
+            and (len(word) * sum(map(len, candidates)) >= _NUMBA_CELLS)
+            and _load_numba()):
+        distances = _numba_distances(
+            _code_points(word), _code_points(''.join(candidates)),
+            np.cumsum([0] + [len(candidate) for candidate in candidates]))
+    else:
+        distances = (_levenshtein(word, candidate)
+                     for candidate in candidates)
+    scored: list[tuple[float, str]] = []
+    for candidate, distance in zip(candidates, distances):
+        similarity: float = 1 - (distance
+                                 / (max(len(word), len(candidate)) or 1))
+        if similarity >= MIN_SIMILARITY:
+            scored.append((similarity, candidate))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [candidate for _, candidate in scored[:MAX_SUGGESTIONS]]
 
 
 class _ParsingError(Exception):
@@ -137,11 +262,13 @@ class _Argument(str):
     the attribute.
     """
 
+    __slots__ = ('name',)
+
     name: str | None
 
     def __new__(cls, value: str = '', name: str | None = None):
         new = super().__new__(_Argument, value)
-        object.__setattr__(new, 'name', name)
+        new.name = name
         return new
 
 
@@ -158,15 +285,20 @@ class _Part:
         if not self.mandatory:
             # strip the brackets
             part = part[1:-1]
-        # self.free_name is set to the name inside the <> in next line if at
-        # least one of the options is free.
+        # self.free_name is set to the name inside the <> if at least one of
+        # the options is free.
         self.free_name: str = ''
         # hard-coded options
-        self.options: list[str] = [
-            option for option in part.split('|')
-            if not self._enclosed(option, '<>') or not self.free_name and
-            setattr(self, 'free_name', option[1:-1])
-        ]
+        self.options: list[str] = []
+        for option in part.split('|'):
+            if not self._enclosed(option, '<>'):
+                # interned, so that comparison with an interned user input
+                # succeeds already on identity
+                self.options.append(sys.intern(option))
+            elif not self.free_name:
+                self.free_name = option[1:-1]
+        # the list keeps the order for the help, the set is used for lookup
+        self._options_set: frozenset[str] = frozenset(self.options)
 
     def __repr__(self) -> str:
         return self._str
@@ -179,20 +311,79 @@ class _Part:
         """Return True if first and last characters of string are the first and
         second characers of enclose, respectively.
         """
-        return string and string[0] == enclose[0] and string[-1] == enclose[1]
+        return (len(string) >= 2 and string[0] == enclose[0]
+                and string[-1] == enclose[1])
 
-    def match(self, user_part: str) -> _Argument:
-        """Return the string that is used as argument to the handler if
-        parseable, else raise _InvalidOption error.
+    def try_match(self, user_part: str) \
+            -> tuple[_Argument | None, _ParsingError | None]:
+        """Return the string that is used as argument to the handler and None
+        if parseable, else None and the _InvalidOption error (not raised).
         """
-        if user_part in self.options:
-            return _Argument(user_part)
+        if user_part in self._options_set:
+            return _Argument(user_part), None
         if self.free_name and user_part:
-            return _Argument(user_part, self.free_name)
+            return _Argument(user_part, self.free_name), None
         if not self.mandatory:
             # it has only hard-coded options and none of them was selected
-            return _Argument()
-        raise _InvalidOption(self, user_part)
+            return _Argument(), None
+        return None, _InvalidOption(self, user_part)
+
+    def match(self, user_part: str) -> _Argument:
+        """Return the string that is used as argument to the handler if
+        parseable, else raise _InvalidOption error.
+        """
+        argument, error = self.try_match(user_part)
+        if error is not None:
+            raise error
+        return argument
+
+    def pattern(self, index: int) -> str:
+        """Return a regular expression matching one user argument (followed
+        by a space) that this part would accept. A hard-coded option is
+        captured in the group o<index>, a free option in the group f<index>.
+        The part is matched atomically, so once it has matched it is never
+        tried again differently, just like in the part-by-part parsing.
+        Without it, a failing match would try all combinations of the parts.
+        """
+        alternatives: list[str] = []
+        if self.options:
+            alternatives.append(
+                f"(?P<o{index}>{'|'.join(map(re.escape, self.options))}) ")
+        if self.free_name:
+            alternatives.append(f'(?P<f{index}>\\S+) ')
+        # a part without any option can never match
+        pattern: str = ('(?:' + ('|'.join(alternatives) or '(?!)') + ')'
+                        + ('' if self.mandatory else '?'))
+        # A lookahead is never backtracked into, the backreference then
+        # consumes what it matched. The same as an atomic group, which is
+        # available only since Python 3.11.
+        return f'(?=(?P<p{index}>{pattern}))(?P=p{index})'
+
+
+class _UserArgs:
+    """The user arguments following the command. Most commands don't match,
+    so the arguments are split only when needed, once for all the wrappers.
+    """
+
+    __slots__ = ('_rest', '_tokens', '_joined')
+
+    def __init__(self, rest: str) -> None:
+        self._rest: str = rest
+        self._tokens: tuple[str, ...] | None = None
+        self._joined: str | None = None
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        if self._tokens is None:
+            self._tokens = tuple(self._rest.split())
+        return self._tokens
+
+    @property
+    def joined(self) -> str:
+        """The arguments, each followed by a single space."""
+        if self._joined is None:
+            self._joined = ''.join(token + ' ' for token in self.tokens)
+        return self._joined
 
 
 class _Wrapper:
@@ -208,17 +399,23 @@ class _Wrapper:
 
         self._command: _Part = descriptor.command
         self._args: tuple[_Part] = descriptor.args
+        self._regex: re.Pattern = descriptor._regex
         # noinspection PyUnresolvedReferences
         self._handler = descriptor.handler.__get__(instance, owner)
         self._syntax: str = descriptor.syntax
-        self._description: str = descriptor.description
-        self._position: int = descriptor.position
-        self._ignore: bool = descriptor.ignore
+        self._syntax_len: int = descriptor._syntax_len
+        # the description is needed only for the help
+        self._descriptor: _Descriptor = descriptor
 
         # tab is the tabulator position, that is later assigned by CommandList
         # in the context of all command wrappers
         self._tab: int | None = None
 
+        # the help entry depends only on the tabulator position and the
+        # indentation, so it is formatted only once for each of them
+        self._lines_cache: dict[tuple[int | None, int], list[str]] = {}
+        self._indent_cache: dict[tuple[int | None, int], str] = {}
+
         # attributes used during command matching to report exceptions
         self._first_exception: _ParsingError | None = None
         self._badness: int = _INITIAL_BADNESS
@@ -232,31 +429,38 @@ class _Wrapper:
     def _str_lines(self, indent: int = 0) -> list[str]:
         """Create the help entry as a list of lines to allow for indentation.
         """
-        if self._tab is None:
-            self._tab = len(self._syntax) + 4
+        key: tuple[int | None, int] = (self._tab, indent)
+        if key not in self._lines_cache:
+            self._lines_cache[key] = self._format_lines(indent)
+        return self._lines_cache[key]
+
+    def _format_lines(self, indent: int) -> list[str]:
+        """Format the help entry, see _str_lines."""
+        tab: int = (self._syntax_len + 4 if self._tab is None
+                    else self._tab)
+        description: str = self._descriptor.description
 
         lines: list[str]
         if not self._syntax:
-            self._tab = 0
-            self._description = ('no command is given, ' + self._description
-                                 + '.')
+            tab = 0
+            description = 'no command is given, ' + description + '.'
             lines = ['If']
-        elif self._tab >= len(self._syntax) + 2:
+        elif tab >= self._syntax_len + 2:
             # the description can be squished to the syntax, as long as there
             # are at least 2 spaces left
-            lines = [self._syntax + ' ' * (self._tab - len(self._syntax) - 1)]
+            lines = [self._syntax + ' ' * (tab - self._syntax_len - 1)]
         else:
             # otherwise the description will begin on the next line
-            lines = [self._syntax, ' ' * (self._tab - 1)]
+            lines = [self._syntax, ' ' * (tab - 1)]
 
         # Prevent the creation of a blank line if the first word is (somehow)
         # too long to fit. In that case, it will be
         # printed anyway.
         not_first_word: bool = False
-        for word in self._description.split():
+        for word in description.split():
             if (len(lines[-1]) + len(word) >= HELP_WIDTH - indent
                     and not_first_word):
-                lines.append(' ' * self._tab + word)
+                lines.append(' ' * tab + word)
             else:
                 lines[-1] += ' ' + word
             not_first_word = True
@@ -266,8 +470,13 @@ class _Wrapper:
         """same as __str__, but add specified number of spaces at the beginning
         of each line.
         """
-        indent: str = ' ' * spaces
-        return indent + ('\n' + indent).join(self._str_lines())
+        key: tuple[int | None, int] = (self._tab, spaces)
+        if key not in self._indent_cache:
+            indent: str = ' ' * spaces
+            self._indent_cache[key] = (indent
+                                       + ('\n' + indent).join(
+                                           self._str_lines()))
+        return self._indent_cache[key]
 
     def __call__(self, user_command: str, *user_args: str) -> bool:
         """Try to parse user input and run the handler in case of success. If
@@ -275,24 +484,78 @@ class _Wrapper:
         don't match, calculate the badness and throw a _ParsingError. If it
         matches and runs smoothly, return True.
         """
-        self._first_exception = None
+        return self.parse(user_command, _UserArgs(' '.join(user_args)))
 
-        # if not user_command and self._command.mandatory:
-        #     return False
-        try:
-            resolved_command: str = self._command.match(user_command)
-        except _ParsingError:
+    def parse(self, user_command: str, user_args: _UserArgs) -> bool:
+        """Same as __call__, but the user arguments are split only if the
+        command matches.
+        """
+        # Most of the commands don't match, so this cheapest test goes first.
+        # It is the same as the failure of self._command.try_match.
+        if (user_command not in self._command._options_set
+                and not (self._command.free_name and user_command)
+                and self._command.mandatory):
             return False
 
-        # if the command carries information, it will be the first argument
-        resolved_args: list[str] = (
-            [resolved_command] if self._command.free_name or
-            not self._command.mandatory else [])
-        if user_command in self._command.options:
+        self._first_exception = None
+        self._badness = _INITIAL_BADNESS
+        resolved_command: _Argument
+        resolved_command, _ = self._command.try_match(user_command)
+        if user_command in self._command._options_set:
             # user typed one of the hardcoded options, so it was probably his
             # intention
             self._badness -= 3
 
+        match: re.Match | None = self._regex.fullmatch(user_args.joined)
+        if match is not None:
+            # The user input matched, try to run the handler.
+            try:
+                self._handler(*self._resolve_match(match, resolved_command))
+            except _ParsingError as e:
+                self._log_exception(e)
+        else:
+            # the input is invalid, parse it part by part to find out why
+            self._parse_parts(user_args.tokens)
+
+        if self._first_exception:
+            self._first_exception.badness += self._badness
+            raise self._first_exception
+
+        return True
+
+    def _resolve_match(self, match: re.Match,
+                       resolved_command: _Argument) -> list[_Argument]:
+        """Convert the successful match of the argument syntax to the handler
+        arguments.
+        """
+        groups: dict[str, str | None] = match.groupdict()
+        # the list has the final size unless the command is omitted
+        resolved_args: list[_Argument | None] = [None] * (len(self._args) + 1)
+        position: int = 0
+        if self._command.free_name or not self._command.mandatory:
+            # if the command carries information, it will be the first
+            # argument
+            resolved_args[0] = resolved_command
+            position = 1
+        for index, part in enumerate(self._args):
+            if (option := groups.get(f'o{index}')) is not None:
+                resolved_args[position] = _Argument(option)
+                # more matches mean this was more probably user's intention
+                self._badness -= 1
+            elif (value := groups.get(f'f{index}')) is not None:
+                resolved_args[position] = _Argument(value, part.free_name)
+                self._badness -= 1
+            else:
+                # optional part was skipped
+                resolved_args[position] = _Argument()
+            position += 1
+        del resolved_args[position:]
+        return resolved_args
+
+    def _parse_parts(self, user_args: tuple[str, ...]) -> None:
+        """Match the user arguments to the parts one by one, pretending a match
+        on every failure, and log all the exceptions.
+        """
         # the for-loop iterates over the parts of the syntax, but we need to
         # iterate over the parts of user_args asynchronously
         user_arg: str | None = None
@@ -305,14 +568,13 @@ class _Wrapper:
             if user_arg is None and part.mandatory:
                 self._log_exception(_MissingMandatory(part))
                 break
-            try:
-                resolved_args.append(part.match(user_arg or ''))
-            except _ParsingError as e:
+            argument, error = part.try_match(user_arg or '')
+            if error is not None:
                 # suppose it is a typo and pretend a match
-                self._log_exception(e)
+                self._log_exception(error)
                 user_arg = None
                 continue
-            if resolved_args[-1]:
+            if argument:
                 # we have matched, the part wasn't skipped as optional
                 user_arg = None
                 # more matches mean this was more probably user's intention
@@ -322,19 +584,6 @@ class _Wrapper:
         elif user_args_index < len(user_args):
             self._log_exception(_Redundant(user_args[user_args_index]))
 
-        if not self._first_exception:
-            # The user input matched, try to run the handler.
-            try:
-                self._handler(*resolved_args)
-            except _ParsingError as e:
-                self._log_exception(e)
-
-        if self._first_exception:
-            self._first_exception.badness += self._badness
-            raise self._first_exception
-
-        return True
-
     def _log_exception(self, exception: _ParsingError) -> None:
         """Save the first exception, but update badness with more exceptions.
         The overall badness is the highest badness of all exceptions.
@@ -360,72 +609,123 @@ class _Descriptor:
         self.command: _Part = command.command
         self.args: tuple[_Part] = command.args
         self.syntax: str = str(command)
-        self.position: int = command.position
+        self._syntax_len: int = len(self.syntax)
         self.ignore: bool = command.ignore
+        # the whole syntax of the arguments compiled at once; user arguments
+        # are matched against it each followed by a single space
+        self._regex: re.Pattern = re.compile(''.join(
+            part.pattern(index) for index, part in enumerate(self.args)))
 
         self.handler = handler
-        self.description: str = handler.__doc__ or 'description not available'
-        self.description = self.description.replace('\n', ' ')
+        # name of the class attribute, set if the descriptor is assigned to one
+        self._name: str | None = None
+        self._raw_doc: str | None = handler.__doc__
 
     def __repr__(self) -> str:
         return self.syntax
 
-    def __get__(self, instance, owner) -> _Wrapper:
-        return _Wrapper(self, instance, owner)
+    @cached_property
+    def description(self) -> str:
+        """The docstring of the handler, processed only if the help is shown.
+        """
+        description: str = self._raw_doc or 'description not available'
+        return description.replace('\n', ' ')
 
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
 
-class CommandListD(tuple[_Descriptor]):
-    """Immutable ordered collection of command descriptors. If it is retrieved
-    using __get__, it will cast all descriptors to wrappers.
+    def __get__(self, instance, owner) -> _Wrapper:
+        if instance is None:
+            return _Wrapper(self, instance, owner)
+        # The wrapper is created only once for each instance and cached in
+        # the instance, so unlike a weak cache keyed by the instance, it
+        # doesn't keep the instance alive. The cache is keyed by the
+        # descriptor, as it can be reached under another name or through
+        # super().
+        wrappers: dict[_Descriptor, _Wrapper] = instance.__dict__.setdefault(
+            '_command_wrappers', {})
+        wrapper: _Wrapper | None = wrappers.get(self)
+        if wrapper is None:
+            wrapper = wrappers[self] = _Wrapper(self, instance, owner)
+            if (self._name is not None
+                    and _lookup(type(instance), self._name) is self):
+                # the instance attribute shadows this non-data descriptor,
+                # so the next access by the name skips __get__
+                instance.__dict__[self._name] = wrapper
+        return wrapper
+
+
+def _lookup(cls: type, name: str) -> object:
+    """Return the class attribute that the name resolves to, without invoking
+    descriptors, or None.
     """
-
-    def __new__(cls, *values: _Descriptor) -> CommandListD:
-        # find the command with the longest syntax and set the tabulator
-        # position accordingly
-        largest_tab = 0
-        for descriptor in values:
-            # if the resulting tabulator value would be too large, skip the
-            # descriptor; it will print the syntax on a separate line
-            if len(descriptor.syntax) + 4 <= MAX_HELP_INDENT:
-                largest_tab = max(largest_tab, len(descriptor.syntax) + 4)
-
-        for descriptor in values:
-            descriptor.tab = largest_tab
-        return super().__new__(cls, values)
-
-    def __get__(self, instance, owner) -> tuple[_Wrapper]:
-        def cast(descriptor: _Descriptor) -> _Wrapper:
-            return descriptor.__get__(instance, owner)
-        return tuple(cast(descriptor) for descriptor in self)
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    return None
 
 
 class CommandList(tuple[_Wrapper]):
     """Immutable ordered collection of command wrappers. At the time of
-    creation it finds the tabulator position.
+    creation it finds the tabulator position, unless it is already known.
     """
 
     # noinspection PyProtectedMember
-    def __new__(cls, *values: _Wrapper) -> CommandList:
-        # find the command with the longest syntax and set the tabulator
-        # position accordingly
-        largest_tab = 0
-        for wrapper in values:
-            # if the resulting tabulator value would be too large, skip the
-            # descriptor; it will print the syntax on a separate line
-            if len(wrapper._syntax) + 4 <= MAX_HELP_INDENT:
-                largest_tab = max(largest_tab, len(wrapper._syntax) + 4)
-
+    def __new__(cls, *values: _Wrapper, tab: int | None = None) \
+            -> CommandList:
+        if tab is None:
+            tab = _largest_tab(wrapper._syntax_len for wrapper in values)
         for wrapper in values:
-            wrapper._tab = largest_tab
+            wrapper._tab = tab
         return super().__new__(cls, values)
 
 
+class _CommandTable:
+    """Immutable ordered collection of command descriptors together with the
+    tabulator position of their help, which is found only once. Binding it
+    to an instance creates the CommandList of wrappers.
+    """
+
+    __slots__ = ('descriptors', 'largest_tab')
+
+    def __init__(self, descriptors: Iterable[_Descriptor],
+                 largest_tab: int | None = None) -> None:
+        self.descriptors: tuple[_Descriptor, ...] = tuple(descriptors)
+        self.largest_tab: int = (
+            _largest_tab(descriptor._syntax_len
+                         for descriptor in self.descriptors)
+            if largest_tab is None else largest_tab)
+
+    def insert(self, position: int, descriptor: _Descriptor) -> _CommandTable:
+        """Return a new table with the descriptor inserted at position."""
+        descriptors: list[_Descriptor] = list(self.descriptors)
+        descriptors.insert(position, descriptor)
+        return _CommandTable(descriptors, max(
+            self.largest_tab, _largest_tab((descriptor._syntax_len,))))
+
+    def bind(self, instance) -> CommandList:
+        """Create the wrappers of all descriptors for the instance."""
+        owner: type = type(instance)
+        return CommandList(*(descriptor.__get__(instance, owner)
+                             for descriptor in self.descriptors),
+                           tab=self.largest_tab)
+
+
+def _largest_tab(syntax_lengths: Iterable[int]) -> int:
+    """Find the command with the longest syntax and return the tabulator
+    position accordingly.
+    """
+    # if the resulting tabulator value would be too large, skip the syntax;
+    # it will be printed on a separate line
+    return max((length + 4 for length in syntax_lengths
+                if length <= MAX_HELP_INDENT - 4), default=0)
+
+
 class Command:
     """The decorator class used to mark a method as a command handler and
     define its syntax. To exclude a command from the command list, set
     the keyword argument 'ignore' to True.
     """
-    next_position: int = 0
 
     def __init__(self, syntax: str, /, ignore: bool = False) -> None:
         try:
@@ -437,8 +737,6 @@ class Command:
         self.args: tuple[_Part] = tuple(_Part(arg) for arg in args)
         self._str: str = (str(self.command)
                           + ''.join(f' {arg}' for arg in self.args))
-        self.position: int = self.__class__.next_position
-        self.__class__.next_position += 1
         self.ignore = ignore
 
     def __call__(self, handler: Callable[..., None]) -> _Descriptor:
@@ -455,96 +753,156 @@ class Command:
 class App:
     """Simple class to further facilitate the app creation."""
 
+    # The commands of the class in the order of definition and the tabulator
+    # position of their help. They are the same for all instances, so they
+    # are found only once when the subclass is created.
+    _command_table: _CommandTable = _CommandTable(())
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Attributes of the subclasses override those of the base classes.
+        # Class dicts keep the order of definition, so the commands of the
+        # base classes come first and an overridden command keeps its place.
+        # With several bases, the commands of the later ones come first.
+        attributes: dict[str, object] = {}
+        for klass in reversed(cls.__mro__):
+            attributes.update(vars(klass))
+        cls._command_table = _CommandTable(
+            attribute for attribute in attributes.values()
+            if isinstance(attribute, _Descriptor) and not attribute.ignore
+        )
+
     def __init__(self, /, s_exit: str = 'e|exit', p_exit: int = sys.maxsize,
                  s_help: str = 'h|help', p_help: int = sys.maxsize) \
             -> None:
         self.running: bool = False
 
         def insert_cmd(handler: Callable, syntax: str, position: int) -> None:
+            nonlocal table
             if syntax:
-                lst.insert(position, Command(syntax)(handler).__get__(
-                    self, self.__class__))
+                table = table.insert(position, Command(syntax)(handler))
 
-        # noinspection PyProtectedMember
-        lst: list[_Wrapper] = sorted(
-            [entry for entry_str in dir(self) if
-             isinstance(entry := getattr(self, entry_str), _Wrapper) and
-             not entry._ignore],
-            key=lambda w: w._position
-        )
+        table: _CommandTable = self._command_table
         if p_exit >= p_help:
             insert_cmd(_help, s_help, p_help)
             insert_cmd(_exit, s_exit, p_exit)
         else:
             insert_cmd(_exit, s_exit, p_exit)
             insert_cmd(_help, s_help, p_help)
-        self.command_list: CommandList = CommandList(*lst)
+        self.command_list: CommandList = table.bind(self)
+        self._help_wrapper: _Wrapper | None = _find_help(self.command_list)
         self.main()
 
     def main(self):
         self.running = True
+        if sys.stdin.isatty():
+            while self.running:
+                resolve(self.command_list, input('>>> '), self._help_wrapper)
+            return
+        # the input is piped, read it directly and stop at its end
         while self.running:
-            resolve(self.command_list, input('>>> '))
+            sys.stdout.write('>>> ')
+            sys.stdout.flush()
+            line: str = sys.stdin.readline()
+            if not line:
+                self.running = False
+                break
+            resolve(self.command_list, line.rstrip('\n'), self._help_wrapper)
 
 
 # noinspection PyPep8Naming
 class resolve:
     """Emulated function. Find a command in command_list that matches the
     user_input and run it. If none is found, print parsing errors that occured
-    and try to find a help command, execute it if it exists.
+    and execute the help command, if it exists. It is either the help_wrapper,
+    or the first command with the hard-coded option 'help'.
     """
 
-    _help_search: bool = False
-
-    def __new__(cls, command_list: Sequence[_Wrapper],
-                user_input: str) -> None:
-        user_list: list[str] = user_input.split() or ['']
+    def __new__(cls, command_list: Sequence[_Wrapper], user_input: str,
+                help_wrapper: _Wrapper | None = None) -> None:
+        # split off only the command, the rest is split when it is needed
+        user_list: list[str] = user_input.split(maxsplit=1) or ['']
+        # matched against the (interned) options of every command
+        user_command: str = sys.intern(user_list[0])
+        user_args: _UserArgs = _UserArgs(user_list[1] if len(user_list) > 1
+                                         else '')
         logged_exceptions: list[_ParsingError] = []
         for command_wrapper in command_list:
             try:
-                if command_wrapper(*user_list):
+                if command_wrapper.parse(user_command, user_args):
                     return
             except _ParsingError as e:
                 logged_exceptions.append(e)
         if logged_exceptions:
-            if cls._help_search:
-                # this is second, recursed run to find help command
-                print('No additional help found.')
-            else:
-                # the user_input was really user input: tell him what is wrong
-                cls._print_exceptions(logged_exceptions)
-                cls._help_search = True
-                resolve(command_list, 'help')
-                cls._help_search = False
-            return
-        # no exception has occured, but also no command matched the user_input.
-        if cls._help_search:
-            print('No additional help found.')
-            return
-        if user_list[0]:
-            print(f'Unknown command {user_list[0]}.')
+            # tell the user what is wrong
+            cls._print_exceptions(logged_exceptions, user_input)
+        elif user_command:
+            # no exception has occured, but also no command matched the
+            # user_input
+            print(f'Unknown command {user_command}.')
+            cls._print_suggestions(command_list, user_command)
             print()
-        cls._help_search = True
-        resolve(command_list, 'help')
-        cls._help_search = False
+        cls._print_help(command_list, help_wrapper)
 
     @classmethod
-    def _print_exceptions(cls, exceptions: list[_ParsingError]):
+    def _print_help(cls, command_list: Sequence[_Wrapper],
+                    help_wrapper: _Wrapper | None) -> None:
+        if help_wrapper is None:
+            help_wrapper = _find_help(command_list)
+        if help_wrapper is not None:
+            try:
+                if help_wrapper('help'):
+                    return
+            except _ParsingError:
+                pass
+        print('No additional help found.')
+
+    @classmethod
+    def _print_suggestions(cls, command_list: Sequence[_Wrapper],
+                           user_command: str) -> None:
+        # noinspection PyProtectedMember
+        candidates: list[str] = list(dict.fromkeys(
+            option for wrapper in command_list
+            for option in wrapper._command.options if option))
+        suggestions: list[str] = _similar(user_command, candidates)
+        if suggestions:
+            print('Did you mean '
+                  + ' or '.join(f"'{option}'" for option in suggestions)
+                  + '?')
+
+    @classmethod
+    def _print_exceptions(cls, exceptions: list[_ParsingError],
+                          user_input: str):
         # print most likely mistakes first
         exceptions.sort(key=lambda err: err.badness)
 
-        # remove duplicities
-        messages: set[str] = set()
-        to_print: list[int] = []
-        for i, e in enumerate(exceptions):
-            if e.message not in messages:
-                messages.add(e.message)
-                to_print.append(i)
-
-        if len(to_print) > 1:
+        # Among the mistakes of equal badness, prefer the messages more
+        # similar to the input. The distance is computed only for them and
+        # only from the beginnings of the strings, it is quadratic.
+        messages: list[str] = []
+        prefix: str = user_input[:_TIEBREAK_LENGTH]
+        for _, group in groupby(exceptions, key=lambda err: err.badness):
+            # remove duplicities, dict keeps the order
+            tied: list[str] = list(dict.fromkeys(e.message for e in group))
+            if len(tied) > 1:
+                tied.sort(key=lambda message: _levenshtein(
+                    message[:_TIEBREAK_LENGTH], prefix))
+            messages += tied
+        # a message may occur with different badness, keep the first
+        messages = list(dict.fromkeys(messages))
+
+        if len(messages) > 1:
             print('    ', end='')
-        print('\nor  '.join(exceptions[i].message for i in to_print),
-              end='.\n\n')
+        print('\nor  '.join(messages), end='.\n\n')
+
+
+def _find_help(command_list: Sequence[_Wrapper]) -> _Wrapper | None:
+    """Return the first wrapper with the hard-coded option 'help', which is
+    executed when the user input cannot be resolved.
+    """
+    # noinspection PyProtectedMember
+    return next((wrapper for wrapper in command_list
+                 if 'help' in wrapper._command._options_set), None)
 
 
 def _exit(self):
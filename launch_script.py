@@ -1,36 +1,31 @@
-import subprocess
-import sys
-import threading
-from os import path
-
-
-class LaunchError(Exception):
-    pass
-
-
-class _Launcher(threading.Thread):
-    def __init__(self, file, *args):
-        super().__init__()
-        self.file = file
-        self.args = args
-        # self.setDaemon(True)
-
-    def run(self):
-        subprocess.run(['python', self.file, *self.args])
-
-
-def Launch(file, *args):
-    if not path.isfile(file) or not file.endswith(".py"):
-        raise LaunchError('Invalid file name')
-    launcher = _Launcher(file, *args)
-    launcher.start()
-
-
-if __name__ == '__main__':
-    print("Launching")
-    try:
-        file_ = sys.argv[1]
-    except IndexError:
-        raise LaunchError('No script specified')
-    Launch(file_, *sys.argv[2:])
-    print("exiting main thread")
+import subprocess
+import sys
+from os import path
+
+
+class LaunchError(Exception):
+    pass
+
+
+def Launch(file, *args):
+    """Run the Python script in a child process with the same interpreter and
+    return its subprocess.Popen handle without waiting. Keep the handle and
+    wait() on it, a handle discarded while the child still runs raises
+    ResourceWarning when it is garbage-collected.
+    """
+    if not path.isfile(file) or not file.endswith(".py"):
+        raise LaunchError('Invalid file name')
+    return subprocess.Popen([sys.executable, file, *args])
+
+
+if __name__ == '__main__':
+    print("Launching")
+    try:
+        file_ = sys.argv[1]
+    except IndexError:
+        raise LaunchError('No script specified')
+    process = Launch(file_, *sys.argv[2:])
+    # like the launcher thread before, stay alive until the script finishes
+    returncode = process.wait()
+    print("exiting main thread")
+    sys.exit(returncode)
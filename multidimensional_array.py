@@ -1,278 +1,392 @@
-from typing import Generic, Optional, Iterable, TypeVar, Union
-
-
-T = TypeVar('T')
-
-
-class Points_iterator(Generic[T]):
-    def __init__(self, array: 'Multidimensional_array[T]'):
-        self.array: Multidimensional_array[T] = array
-        self._stop: bool = False
-        self._iter_pos: Optional[tuple[int, ...]] = None
-
-    def __iter__(self) -> 'Points_iterator[T]':
-        if self.array._number_of_dimensions == 0:
-            self._stop = True
-        else:
-            self._iter_pos = [0] * self.array._number_of_dimensions
-            self._stop = False
-        return self
-
-    def __next__(self) -> T:
-        if self._stop:
-            self._stop = False
-            raise StopIteration
-        item: T = self.array[self._iter_pos]
-        for dimension in range(self.array._number_of_dimensions):
-            self._iter_pos[dimension] += 1
-            if self._iter_pos[dimension] == self.array.get_dimensions()[dimension]:
-                self._iter_pos[dimension] = 0
-            else:
-                return item
-        self._stop = True
-        return item
-
-
-class Enumerated_iterator(Generic[T]):
-    def __init__(self, array: 'Multidimensional_array[T]'):
-        self.array: Multidimensional_array[T] = array
-
-    def __iter__(self) -> 'Enumerated_iterator[T]':
-        self.array.points.__iter__()
-        return self
-
-    def __next__(self) -> T:
-        pos: tuple[int, ...] = tuple(self.array.points._iter_pos)
-        return pos, self.array.points.__next__()
-
-
-class ID_generator:
-    def __init__(self):
-        self._lock = list()
-
-    def __str__(self):
-        return f'{id(self)}; {self._last_ID}; {self._lock}'
-
-    def next(self):
-        # print(f'ID_generator.next(): {id(self)}')
-        if len(self._lock):
-            return self._lock[-1]
-        self._last_ID += 1
-        return self._last_ID
-
-    def lock(self, ID):
-        self._lock.append(ID)
-
-    def unlock(self):
-        del self._lock[-1]
-
-    @property
-    def _last_ID(self):
-        global last_ID_tmp
-        # print(f'returning last ID: {id(self)}; {last_ID_tmp}')
-        return last_ID_tmp
-
-    @_last_ID.setter
-    def _last_ID(self, value):
-        global last_ID_tmp
-        # print(f'changing last ID: {id(self)}; {last_ID_tmp}; {value}')
-        last_ID_tmp = value
-
-
-class Multidimensional_array(Generic[T]):
-    # ID = ID_generator()
-    _last_ID: int = -1
-    _lock: list[int] = list()
-
-    @classmethod
-    def next_ID(cls) -> int:
-        if len(cls._lock):
-            return cls._lock[-1]
-        cls._last_ID += 1
-        return cls._last_ID
-
-    @classmethod
-    def lock_ID(cls, ID: int) -> None:
-        cls._lock.append(ID)
-
-    @classmethod
-    def unlock_ID(cls) -> None:
-        del cls._lock[-1]
-
-    def __init__(self, dimensions: tuple[int, ...] = (1, 1), iterable: Union[Iterable, T, None] = None, fill: T = None):
-        if iterable is None:
-            iterable = list()
-
-        # self.ID = Multidimensional_array.ID
-        # self._ID = self.ID.next()
-        self._ID: int = Multidimensional_array.next_ID()
-
-        self.enumerated: Enumerated_iterator[T] = Enumerated_iterator(self)
-        self.points: Points_iterator[T] = Points_iterator(self)
-        self._fill: T = fill
-        self._number_of_dimensions: int = 0
-        self.values: list[Union[Multidimensional_array, T]]
-        for dim in dimensions:
-            if dim <= 0:
-                break
-            self._number_of_dimensions += 1
-        self._dimensions: tuple[int, ...] = tuple(dimensions[:self._number_of_dimensions])
-        if not self._number_of_dimensions:
-            # super().__init__()
-            self.values = list()
-            return
-        try:
-            iter(iterable)
-        except TypeError:
-            iterable = [iterable]
-        if isinstance(iterable, Multidimensional_array):
-            # iterable = [list.__getitem__(iterable, i) for i in range(iterable.get_dimensions()[-1])]
-            iterable = iterable.values.copy()
-        else:
-            iterable = list(iterable)
-        if len(iterable) < dimensions[-1]:
-            iterable += [fill for _ in range(dimensions[-1] - len(iterable))]
-        numdim: int = self._number_of_dimensions - 1
-        if numdim > 0:
-            Multidimensional_array.lock_ID(self._ID)
-            sublists: list[Multidimensional_array] = [Multidimensional_array(dimensions[:-1], item, fill=fill)
-                                                      for item in iterable[:dimensions[-1]]]
-            Multidimensional_array.unlock_ID()
-        else:
-            sublists: list[T] = iterable[:dimensions[-1]]
-        # super().__init__()
-        # self += sublists
-        self.values = sublists
-
-    def __str__(self) -> str:
-        return str(self.values)
-
-    def __repr__(self) -> str:
-        return str(self)
-
-    def __getitem__(self, coordinates: Union[tuple, slice, int]) -> Union['Multidimensional_array', T]:
-        # x coordinate is deepest in the list structure
-        coordinates = self._complete_coordinates(coordinates)
-        coordinate = coordinates[0]
-        if coordinate is None:
-            coordinate = slice(None)
-        if isinstance(coordinate, int):
-            # subarray = list.__getitem__(self, coordinate)
-            subarray = self.values[coordinate]
-
-            coordinates.reverse()
-            return subarray[coordinates[:-1]] if len(coordinates) > 1 else subarray
-        if isinstance(coordinate, slice):
-            # sliced = list.__getitem__(self, coordinate)
-            sliced = self.values[coordinate]
-
-            if len(coordinates) > 1:
-                coordinates.reverse()
-                sliced = [subarray[coordinates[:-1]] for subarray in sliced]
-            try:
-                dim = sliced[0].get_dimensions()
-            except (IndexError, AttributeError):
-                dim = ()
-            out = Multidimensional_array(dim + (len(sliced),), sliced, self._fill)
-            out._ID = self._ID
-            return out
-        raise TypeError('coordinates must be in form of tuple of integers, slices or None')
-
-    def __setitem__(self, key: Union[tuple, slice, int], value: Union['Multidimensional_array', T]) -> None:
-        target = self[key]
-        coordinates = self._complete_coordinates(key)
-        if isinstance(target, Multidimensional_array) and target._ID == self._ID:
-            if not isinstance(value, Multidimensional_array) or value.get_dimensions() != target.get_dimensions():
-                raise TypeError('can only assign a Multidimensional_array of the same size as target')
-            coordinates.reverse()
-            for relative, item in value.enumerated:
-                relative_iter = iter(relative)
-                completed = coordinates.copy()
-                for index, coordinate in enumerate(coordinates):
-                    if coordinate is None:
-                        coordinate = slice(None)
-                    if isinstance(coordinate, slice):
-                        completed[index] = range(coordinate.start if isinstance(coordinate.start, int) else 0,
-                                                 coordinate.stop if isinstance(coordinate.stop, int) else
-                                                 self.get_dimensions()[index], coordinate.step if
-                                                 isinstance(coordinate.step, int) else 1)[next(relative_iter)]
-                self[completed] = item
-        else:
-            subarray = self
-            for coordinate in coordinates[:-1]:
-                # subarray = list.__getitem__(subarray, coordinate)
-                subarray = subarray.values[coordinate]
-            # list.__setitem__(subarray, coordinates[-1], value)
-            subarray.values[coordinates[-1]] = value
-
-    def _complete_coordinates(self, coordinates: Union[tuple, slice, int]) -> list[Union[slice, int]]:
-        try:
-            iter(coordinates)
-        except TypeError:
-            coordinates = [coordinates]
-        else:
-            coordinates = list(coordinates)
-        if len(coordinates) < self._number_of_dimensions:
-            coordinates += [slice(None) for _ in range(self._number_of_dimensions - len(coordinates))]
-        elif len(coordinates) > self._number_of_dimensions:
-            coordinates = coordinates[:self._number_of_dimensions]
-        coordinates.reverse()
-        return coordinates
-
-    def get_dimensions(self) -> tuple[int, ...]:
-        return self._dimensions
-
-    def copy(self) -> 'Multidimensional_array':
-        return Multidimensional_array(self.get_dimensions(), self.list(), self._fill)
-
-    def list(self) -> list:
-        # return [list.__getitem__(self, i).list() if len(self.get_dimensions()) > 1 else list.__getitem__(self, i)
-        #         for i in range(self.get_dimensions()[-1])]
-        return [self.values[i].list() if len(self.get_dimensions()) > 1 else self.values[i]
-                for i in range(self.get_dimensions()[-1])]
-
-    def print(self) -> None:
-        if len(self._dimensions) == 2:
-            for j in range(self.get_dimensions()[1]):
-                for i in range(self.get_dimensions()[0]):
-                    print(self[i, j], end='')
-                print()
-            print()
-        else:
-            print(str(self))
-
-    def count(self, object: T) -> int:
-        count = 0
-        for item in self.points:
-            if object == item:
-                count += 1
-        return count
-
-
-if __name__ == "__main__":
-    array = Multidimensional_array((4, 3), ['1234', 'abcd', Multidimensional_array((3,), 'AB', 'C')])
-    print(array, end='\n\n')
-    for j in range(array.get_dimensions()[1]):
-        for i in range(array.get_dimensions()[0]):
-            print(array[i, j], end='')
-        print()
-    print()
-    for item in array.points:
-        print(item)
-    print()
-    for item in array.enumerated:
-        print(item)
-    print('\n\n\n\n')
-    array = Multidimensional_array((2, 2, 2, 2), [[[[1, 1], [1, 1]], [[1, 1], [1, 1]]], [[[1, 1], [1, 1]], [[1, 1], [1, 1]]]])
-    array1 = array.copy()
-    print(array == array1, array is array1)
-    for a in range(2):
-        for b in range(2):
-            for c in range(2):
-                for d in range(2):
-                    array1[a, b, c, d] = f'{a}{b}{c}{d}'
-    print(array1, array, '', sep='\n')
-    array = Multidimensional_array((5,), [0, 1, 2, 3, 4])
-    array[0] = None
-    array[1:4] = Multidimensional_array((3,), 'abc')
-    print(array)
+from __future__ import annotations
+
+from array import array as typed_array
+from itertools import accumulate
+from operator import mul
+from typing import TYPE_CHECKING, Iterable, Union
+
+if TYPE_CHECKING:
+    # the item type exists only for the annotations, the classes are not generic at runtime
+    from typing import TypeVar
+    T = TypeVar('T')
+
+# Arrays whose items all have one of these types are stored in a compact typed buffer instead of a list, the
+# typecodes hold any float and any int that fits into 64 bits.
+ITEM_TYPES: dict[str, type] = {'q': int, 'd': float}
+TYPECODES: dict[type, str] = {item_type: typecode for typecode, item_type in ITEM_TYPES.items()}
+
+
+class Points_iterator:
+    __slots__ = ('array', '_buf', '_flat', '_total')
+
+    def __init__(self, array: 'Multidimensional_array'):
+        self.array: Multidimensional_array = array
+        self._buf: Union[list[T], typed_array] = list()
+        # index of the next point in the flat buffer and the number of points
+        self._flat: int = 0
+        self._total: int = 0
+
+    def __iter__(self) -> 'Points_iterator':
+        # the buffer is walked directly, without going through the array
+        self._buf = self.array._buf
+        self._flat = 0
+        self._total = len(self._buf)
+        return self
+
+    def __next__(self) -> T:
+        if self._flat >= self._total:
+            raise StopIteration
+        item: T = self._buf[self._flat]
+        self._flat += 1
+        return item
+
+
+class Enumerated_iterator:
+    __slots__ = ('array', '_dims', '_position')
+
+    def __init__(self, array: 'Multidimensional_array'):
+        self.array: Multidimensional_array = array
+        self._dims: tuple[int, ...] = ()
+        # coordinates of the next point, advanced in step with the points iterator
+        self._position: list[int] = []
+
+    def __iter__(self) -> 'Enumerated_iterator':
+        self.array.points.__iter__()
+        # the shape cannot change during the iteration
+        self._dims = self.array._dimensions
+        self._position = [0] * len(self._dims)
+        return self
+
+    def __next__(self) -> tuple[tuple[int, ...], T]:
+        item: T = self.array.points.__next__()
+        pos: tuple[int, ...] = tuple(self._position)
+        # increment the position like a counter, x coordinate first
+        for axis, size in enumerate(self._dims):
+            self._position[axis] += 1
+            if self._position[axis] < size:
+                break
+            self._position[axis] = 0
+        return pos, item
+
+
+class ID_generator:
+    __slots__ = ('_lock',)
+
+    def __init__(self):
+        self._lock = list()
+
+    def __str__(self):
+        return f'{id(self)}; {self._last_ID}; {self._lock}'
+
+    def next(self):
+        # print(f'ID_generator.next(): {id(self)}')
+        if len(self._lock):
+            return self._lock[-1]
+        self._last_ID += 1
+        return self._last_ID
+
+    def lock(self, ID):
+        self._lock.append(ID)
+
+    def unlock(self):
+        del self._lock[-1]
+
+    @property
+    def _last_ID(self):
+        global last_ID_tmp
+        # print(f'returning last ID: {id(self)}; {last_ID_tmp}')
+        return last_ID_tmp
+
+    @_last_ID.setter
+    def _last_ID(self, value):
+        global last_ID_tmp
+        # print(f'changing last ID: {id(self)}; {last_ID_tmp}; {value}')
+        last_ID_tmp = value
+
+
+class Multidimensional_array:
+    __slots__ = ('_ID', '_enumerated', '_points', '_fill', '_number_of_dimensions', '_dimensions', '_strides', '_pad',
+                 '_buf')
+
+    # ID = ID_generator()
+    _last_ID: int = -1
+    _lock: list[int] = list()
+
+    @classmethod
+    def next_ID(cls) -> int:
+        if len(cls._lock):
+            return cls._lock[-1]
+        cls._last_ID += 1
+        return cls._last_ID
+
+    @classmethod
+    def lock_ID(cls, ID: int) -> None:
+        cls._lock.append(ID)
+
+    @classmethod
+    def unlock_ID(cls) -> None:
+        del cls._lock[-1]
+
+    def __init__(self, dimensions: tuple[int, ...] = (1, 1), iterable: Union[Iterable, T, None] = None, fill: T = None):
+        # self.ID = Multidimensional_array.ID
+        # self._ID = self.ID.next()
+        self._ID: int = Multidimensional_array.next_ID()
+
+        # the iterators are created on the first use, most subarrays are never iterated
+        self._enumerated: Union[Enumerated_iterator, None] = None
+        self._points: Union[Points_iterator, None] = None
+        self._fill: T = fill
+        number_of_dimensions: int = 0
+        for dim in dimensions:
+            if dim <= 0:
+                break
+            number_of_dimensions += 1
+        self._number_of_dimensions: int = number_of_dimensions
+        self._dimensions: tuple[int, ...]
+        if number_of_dimensions == len(dimensions) and type(dimensions) is tuple:
+            # nothing to truncate, the tuple can be shared
+            self._dimensions = dimensions
+        else:
+            self._dimensions = tuple(dimensions[:number_of_dimensions])
+        # All items are stored in a single flat list, x coordinate changes the fastest. Item at coordinates c is at
+        # index sum(c[i] * self._strides[i]).
+        self._strides: tuple[int, ...] = tuple(accumulate(self._dimensions[:-1], mul, initial=1))
+        # used to complete the omitted coordinates
+        self._pad: tuple[slice, ...] = (slice(None),) * self._number_of_dimensions
+        self._buf: Union[list[T], typed_array]
+        if isinstance(iterable, Multidimensional_array) and iterable._dimensions == self._dimensions:
+            # an array of the same shape needs neither expanding nor padding
+            self._buf = iterable._buf[:]
+        else:
+            self._buf = self._compact(self._flatten(iterable)) if self._number_of_dimensions else list()
+
+    def _flatten(self, iterable: Union[Iterable, T, None]) -> list[T]:
+        # Expand the nested iterables one dimension at a time, starting with the last one, without recursion. Items
+        # are expanded in place, so the order of the resulting items is the order of the buffer.
+        items: list = [iterable]
+        for size in reversed(self._dimensions):
+            expanded: list = list()
+            for item in items:
+                if item is None:
+                    item = list()
+                try:
+                    iter(item)
+                except TypeError:
+                    item = [item]
+                if isinstance(item, Multidimensional_array):
+                    item = item._subarrays()
+                else:
+                    item = list(item)
+                if len(item) < size:
+                    item += [self._fill] * (size - len(item))
+                expanded += item[:size]
+            items = expanded
+        return items
+
+    @staticmethod
+    def _compact(items: list[T]) -> Union[list[T], typed_array]:
+        # use a typed buffer if all items are ints or all are floats, bool and other subclasses stay in a list
+        types: set[type] = set(map(type, items))
+        if len(types) == 1 and (typecode := TYPECODES.get(types.pop())) is not None:
+            try:
+                return typed_array(typecode, items)
+            except OverflowError:
+                pass
+        return items
+
+    def _holds(self, items: Iterable) -> bool:
+        # whether the buffer can store the items without converting them
+        return type(self._buf) is list or not set(map(type, items)) - {ITEM_TYPES[self._buf.typecode]}
+
+    def _untype(self) -> None:
+        # switch to a list buffer, a running iteration continues over the new buffer
+        self._buf = list(self._buf)
+        if self._points is not None:
+            self._points._buf = self._buf
+
+    @classmethod
+    def _from_buffer(cls, dimensions: tuple[int, ...], buffer: Union[list[T], typed_array], fill: T,
+                     ID: int) -> 'Multidimensional_array':
+        # create the array directly from a buffer of matching size
+        out = cls.__new__(cls)
+        out._ID = ID
+        out._enumerated = None
+        out._points = None
+        out._fill = fill
+        out._number_of_dimensions = len(dimensions)
+        out._dimensions = dimensions
+        out._strides = tuple(accumulate(dimensions[:-1], mul, initial=1))
+        out._pad = (slice(None),) * len(dimensions)
+        out._buf = buffer
+        return out
+
+    @property
+    def points(self) -> Points_iterator:
+        if self._points is None:
+            self._points = Points_iterator(self)
+        return self._points
+
+    @property
+    def enumerated(self) -> Enumerated_iterator:
+        if self._enumerated is None:
+            self._enumerated = Enumerated_iterator(self)
+        return self._enumerated
+
+    def _subarrays(self) -> list[Union['Multidimensional_array', T]]:
+        # copies of the subarrays along the last dimension, or the items if there is only one dimension
+        if self._number_of_dimensions <= 1:
+            return list(self._buf)
+        inner: tuple[slice, ...] = (slice(None),) * (self._number_of_dimensions - 1)
+        return [self[inner + (i,)] for i in range(self._dimensions[-1])]
+
+    def __str__(self) -> str:
+        return str(self.list())
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def _ranges(self, coordinates: tuple[Union[slice, int, None], ...]) -> list[Union[range, int]]:
+        # normalize the coordinates: ints become nonnegative indices, slices become ranges of indices
+        ranges: list[Union[range, int]] = []
+        for coordinate, size in zip(coordinates, self._dimensions):
+            if coordinate is None:
+                coordinate = slice(None)
+            if not isinstance(coordinate, (int, slice)):
+                raise TypeError('coordinates must be in form of tuple of integers, slices or None')
+            ranges.append(range(size)[coordinate])
+        return ranges
+
+    def _offsets(self, ranges: list[Union[range, int]]) -> list[int]:
+        # indices into the buffer of all points selected by the ranges, x coordinate changes the fastest
+        offsets: list[int] = [0]
+        for indices, stride in zip(ranges, self._strides):
+            if isinstance(indices, int):
+                offsets = [offset + indices * stride for offset in offsets]
+            else:
+                offsets = [offset + index * stride for index in indices for offset in offsets]
+        return offsets
+
+    def __getitem__(self, coordinates: Union[tuple, slice, int]) -> Union['Multidimensional_array', T]:
+        if type(coordinates) is tuple and len(coordinates) == self._number_of_dimensions:
+            # a single point given by nonnegative ints in range is loaded directly, anything else (including negative
+            # indices and errors) goes through the generic path
+            offset: int = 0
+            for coordinate, size, stride in zip(coordinates, self._dimensions, self._strides):
+                if type(coordinate) is not int or not 0 <= coordinate < size:
+                    break
+                offset += coordinate * stride
+            else:
+                return self._buf[offset]
+        coordinates = self._complete_coordinates(coordinates)
+        ranges = self._ranges(coordinates)
+        dimensions: tuple[int, ...] = tuple(len(indices) for indices in ranges if isinstance(indices, range))
+        if not dimensions:
+            return self._buf[self._offsets(ranges)[0]]
+        if 0 in dimensions:
+            # nothing is selected
+            return Multidimensional_array._from_buffer((), list(), self._fill, self._ID)
+        buffer: Union[list[T], typed_array] = [self._buf[offset] for offset in self._offsets(ranges)]
+        if type(self._buf) is not list:
+            buffer = typed_array(self._buf.typecode, buffer)
+        return Multidimensional_array._from_buffer(dimensions, buffer, self._fill, self._ID)
+
+    def __setitem__(self, key: Union[tuple, slice, int], value: Union['Multidimensional_array', T]) -> None:
+        coordinates = self._complete_coordinates(key)
+        ranges = self._ranges(coordinates)
+        dimensions: tuple[int, ...] = tuple(len(indices) for indices in ranges if isinstance(indices, range))
+        items: Iterable
+        if not dimensions:
+            items = (value,)
+        else:
+            if 0 in dimensions:
+                dimensions = ()
+            if not isinstance(value, Multidimensional_array) or value._dimensions != dimensions:
+                raise TypeError('can only assign a Multidimensional_array of the same size as target')
+            items = value._buf
+        offsets: list[int] = self._offsets(ranges)
+        if not self._holds(items):
+            self._untype()
+        try:
+            for offset, item in zip(offsets, items):
+                self._buf[offset] = item
+        except OverflowError:
+            # an int too large for the typed buffer, storing the items again is harmless
+            self._untype()
+            for offset, item in zip(offsets, items):
+                self._buf[offset] = item
+
+    def _complete_coordinates(self, coordinates: Union[tuple, slice, int]) -> tuple[Union[slice, int], ...]:
+        if not isinstance(coordinates, tuple):
+            try:
+                iter(coordinates)
+            except TypeError:
+                coordinates = (coordinates,)
+            else:
+                coordinates = tuple(coordinates)
+        if len(coordinates) < self._number_of_dimensions:
+            return coordinates + self._pad[len(coordinates):]
+        if len(coordinates) > self._number_of_dimensions:
+            return coordinates[:self._number_of_dimensions]
+        return coordinates
+
+    def get_dimensions(self) -> tuple[int, ...]:
+        return self._dimensions
+
+    def copy(self) -> 'Multidimensional_array':
+        # the shape is already valid, only the buffer has to be duplicated
+        return Multidimensional_array._from_buffer(self._dimensions, self._buf[:], self._fill,
+                                                   Multidimensional_array.next_ID())
+
+    def list(self) -> list:
+        # group the flat buffer by the dimensions, starting with the x coordinate
+        nested: list = list(self._buf)
+        for size in self._dimensions[:-1]:
+            nested = [nested[i:i + size] for i in range(0, len(nested), size)]
+        return nested
+
+    def print(self) -> None:
+        if len(self._dimensions) == 2:
+            for j in range(self._dimensions[1]):
+                for i in range(self._dimensions[0]):
+                    print(self[i, j], end='')
+                print()
+            print()
+        else:
+            print(str(self))
+
+    def count(self, object: T) -> int:
+        if type(self._buf) is not list:
+            # The ints or floats are new objects on every read, never identical to object unless equal anyway, so
+            # the single pass in C compares all of them by ==.
+            return self._buf.count(object)
+        # list.count would count items identical to object without comparing them, such as nan
+        return sum(1 for item in self._buf if object == item)
+
+
+if __name__ == "__main__":
+    array = Multidimensional_array((4, 3), ['1234', 'abcd', Multidimensional_array((3,), 'AB', 'C')])
+    print(array, end='\n\n')
+    for j in range(array.get_dimensions()[1]):
+        for i in range(array.get_dimensions()[0]):
+            print(array[i, j], end='')
+        print()
+    print()
+    for item in array.points:
+        print(item)
+    print()
+    for item in array.enumerated:
+        print(item)
+    print('\n\n\n\n')
+    array = Multidimensional_array((2, 2, 2, 2), [[[[1, 1], [1, 1]], [[1, 1], [1, 1]]], [[[1, 1], [1, 1]], [[1, 1], [1, 1]]]])
+    array1 = array.copy()
+    print(array == array1, array is array1)
+    for a in range(2):
+        for b in range(2):
+            for c in range(2):
+                for d in range(2):
+                    array1[a, b, c, d] = f'{a}{b}{c}{d}'
+    print(array1, array, '', sep='\n')
+    array = Multidimensional_array((5,), [0, 1, 2, 3, 4])
+    array[0] = None
+    array[1:4] = Multidimensional_array((3,), 'abc')
+    print(array)